@@ -0,0 +1,39 @@
+"""Add composite index on audit_logs (tenant_id, action, created_at)
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17 00:00:00.000000
+
+Serves tenant audit listings filtered by action (AuditLogRepository.list_by_tenant
+with an action filter, latest identity.assumed lookups) without sorting: the
+index is scanned backwards for created_at DESC.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from src.alembic.migration_utils import is_tenant_migration
+
+revision: str = "019"
+down_revision: str | None = "018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if is_tenant_migration():
+        return
+
+    op.create_index(
+        "ix_audit_logs_tenant_action_created",
+        "audit_logs",
+        ["tenant_id", "action", "created_at"],
+        schema="public",
+    )
+
+
+def downgrade() -> None:
+    if is_tenant_migration():
+        return
+
+    op.drop_index("ix_audit_logs_tenant_action_created", table_name="audit_logs", schema="public")
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from alembic import command
 from alembic.config import Config
+from alembic.script import ScriptDirectory
 
 
 def _get_alembic_config() -> Config:
@@ -31,3 +32,8 @@ def run_migrations_sync(schema_name: str | None = None) -> None:
         command.upgrade(alembic_cfg, "head", tag=schema_name)
     else:
         command.upgrade(alembic_cfg, "head")
+
+
+def get_head_revision() -> str | None:
+    """Return the head revision of the migration scripts."""
+    return ScriptDirectory.from_config(_get_alembic_config()).get_current_head()
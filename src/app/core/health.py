@@ -2,6 +2,7 @@
 
 import secrets
 import time
+from collections.abc import Callable
 from typing import Any
 
 from fastapi import Depends, FastAPI, HTTPException, status
@@ -20,6 +21,7 @@ from src.app.temporal.client import get_temporal_client
 _health_cache: dict[str, Any] | None = None
 _health_cache_time: float = 0
 HEALTH_CACHE_TTL = 10  # seconds
+_clock: Callable[[], float] = time.time
 
 
 def reset_health_cache() -> None:
@@ -29,6 +31,12 @@ def reset_health_cache() -> None:
     _health_cache_time = 0
 
 
+def set_health_clock(clock: Callable[[], float]) -> None:
+    """Set the time source used for cache ages (for testing; default time.time)."""
+    global _clock
+    _clock = clock
+
+
 def setup_health_endpoint(app: FastAPI) -> None:
     """Configure the health check endpoint."""
 
@@ -37,7 +45,7 @@ def setup_health_endpoint(app: FastAPI) -> None:
         """Health check with dependency validation and caching."""
         global _health_cache, _health_cache_time
 
-        now = time.time()
+        now = _clock()
 
         # If shutting down, always return draining status
         if request_tracker.is_shutting_down:
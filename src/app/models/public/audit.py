@@ -57,6 +57,7 @@ class AuditLog(SQLModel, table=True):
     __tablename__ = "audit_logs"
     __table_args__ = (
         Index("ix_audit_logs_tenant_created", "tenant_id", "created_at"),
+        Index("ix_audit_logs_tenant_action_created", "tenant_id", "action", "created_at"),
         Index("ix_audit_logs_user_created", "user_id", "created_at"),
         Index("ix_audit_logs_action_created", "action", "created_at"),
         Index("ix_audit_logs_entity", "entity_type", "entity_id"),
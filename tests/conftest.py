@@ -1,7 +1,7 @@
 """Root test fixtures shared across all test types.
 
 This conftest contains fixtures that can be used by both unit and integration tests.
-Database-specific fixtures are in tests/integration/conftest.py.
+Database-specific fixtures are in tests/integration/conftest.py; unit tests need none.
 """
 
 import os
@@ -10,11 +10,19 @@ import os
 os.environ.setdefault("APP_ENV", "testing")
 # Disable SSL for local test database (PostgreSQL without SSL support)
 os.environ.setdefault("DATABASE_SSL_MODE", "disable")
+# Cheapest valid Argon2id parameters: the hasher is built from settings at import,
+# and every registration/login in the suite would otherwise pay production cost.
+# Export ARGON2_* explicitly to test with real parameters.
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "8")
 
 # ruff: noqa: E402 - Imports must be after env var setup
+import asyncio
+import warnings
 from collections.abc import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 from fakeredis import aioredis as fakeredis_aio
 from redis.asyncio import Redis
 
@@ -25,6 +33,46 @@ from src.app.core.config import get_settings
 # Clear settings cache to ensure test environment variables are picked up
 get_settings.cache_clear()
 
+# Fixtures whose use implies a database (and, for tenants, a migrated schema).
+# Tests requesting any of them directly or transitively get the matching marker.
+_DB_FIXTURES = frozenset({"engine", "db_session"})
+_TENANT_FIXTURES = frozenset({"test_tenant", "test_tenant_obj"})
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Auto-apply ``db``/``tenant`` markers based on requested fixtures.
+
+    Lets ``pytest -m "not db"`` select the pure tests without ever building the
+    engine, and keeps the markers accurate without hand-tagging every test.
+    """
+    for item in items:
+        fixturenames = set(getattr(item, "fixturenames", ()))
+        if fixturenames & _TENANT_FIXTURES:
+            item.add_marker(pytest.mark.tenant)
+            item.add_marker(pytest.mark.db)
+        elif fixturenames & _DB_FIXTURES:
+            item.add_marker(pytest.mark.db)
+
+
+# --- Event Loop ---
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session's event loop on uvloop where available.
+
+    uvloop comes in with uvicorn[standard] (not on Windows) and drops its policy
+    class on Python 3.16; otherwise fall back to pytest-asyncio's default.
+    """
+    try:
+        from uvloop import EventLoopPolicy
+    except ImportError:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            return asyncio.get_event_loop_policy()
+    return EventLoopPolicy()
+
+
 # --- Rate Limit Fixtures ---
 
 
@@ -44,16 +92,25 @@ def reset_rate_limit_buckets() -> None:
 # --- Redis Test Fixtures (shared) ---
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _fake_redis_client() -> AsyncGenerator[Redis]:
+    """Single fakeredis client reused by every test in the session (per worker)."""
+    client = fakeredis_aio.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
 @pytest.fixture
-async def fake_redis() -> AsyncGenerator[Redis]:
+async def fake_redis(_fake_redis_client: Redis) -> AsyncGenerator[Redis]:
     """Provides a fakeredis client for testing.
 
     Returns an in-memory Redis implementation that behaves like
     a real Redis server but doesn't require external dependencies.
+    The client is shared across tests and flushed after each one, so
+    every test still starts from an empty keyspace.
     """
-    client = fakeredis_aio.FakeRedis(decode_responses=True)
-    yield client
-    await client.aclose()
+    yield _fake_redis_client
+    await _fake_redis_client.flushall()
 
 
 @pytest.fixture
@@ -2,25 +2,66 @@
 
 Re-exports all factories for convenient imports:
     from tests.factories import UserFactory, TenantFactory, ...
+
+Exports are resolved lazily (PEP 562), so importing one factory module, or
+collecting tests that never touch factories, doesn't pull in every model and
+the password hasher.
 """
 
-from tests.factories.auth import (
-    EmailVerificationTokenFactory,
-    RefreshTokenFactory,
-    TenantInviteFactory,
-)
-from tests.factories.base import BaseFactory, generate_uuid7, utc_now
-from tests.factories.tenant import TenantFactory
-from tests.factories.user import (
-    DEFAULT_TEST_PASSWORD,
-    UserFactory,
-    UserTenantMembershipFactory,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tests.factories.auth import (
+        EmailVerificationTokenFactory,
+        RefreshTokenFactory,
+        TenantInviteFactory,
+    )
+    from tests.factories.base import (
+        BaseFactory,
+        as_insert_row,
+        generate_uuid7,
+        random_bytes,
+        random_suffix,
+        sha256_hex,
+        utc_now,
+    )
+    from tests.factories.tenant import TenantFactory
+    from tests.factories.user import (
+        DEFAULT_TEST_PASSWORD,
+        UserFactory,
+        UserTenantMembershipFactory,
+    )
+
+_LAZY_EXPORTS: dict[str, str] = {
+    # Base
+    "BaseFactory": "tests.factories.base",
+    "as_insert_row": "tests.factories.base",
+    "generate_uuid7": "tests.factories.base",
+    "random_bytes": "tests.factories.base",
+    "random_suffix": "tests.factories.base",
+    "sha256_hex": "tests.factories.base",
+    "utc_now": "tests.factories.base",
+    # Tenant
+    "TenantFactory": "tests.factories.tenant",
+    # User
+    "UserFactory": "tests.factories.user",
+    "UserTenantMembershipFactory": "tests.factories.user",
+    "DEFAULT_TEST_PASSWORD": "tests.factories.user",
+    # Auth
+    "RefreshTokenFactory": "tests.factories.auth",
+    "EmailVerificationTokenFactory": "tests.factories.auth",
+    "TenantInviteFactory": "tests.factories.auth",
+}
 
 __all__ = [
     # Base
     "BaseFactory",
+    "as_insert_row",
     "generate_uuid7",
+    "random_bytes",
+    "random_suffix",
+    "sha256_hex",
     "utc_now",
     # Tenant
     "TenantFactory",
@@ -33,3 +74,16 @@ __all__ = [
     "EmailVerificationTokenFactory",
     "TenantInviteFactory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
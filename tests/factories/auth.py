@@ -1,20 +1,29 @@
 """Authentication-related factories for test data generation."""
 
-import secrets
 from datetime import timedelta
-from hashlib import sha256
 from uuid import UUID
 
 from polyfactory import Use
 
 from src.app.models.enums import InviteStatus, MembershipRole
 from src.app.models.public import EmailVerificationToken, RefreshToken, TenantInvite
-from tests.factories.base import BaseFactory, generate_uuid7, utc_now
+from tests.factories.base import (
+    BaseFactory,
+    generate_uuid7,
+    random_bytes,
+    random_suffix,
+    sha256_hex,
+    utc_now,
+)
 
 
 def generate_token_hash() -> str:
-    """Generate a random token hash."""
-    return sha256(secrets.token_urlsafe(32).encode()).hexdigest()
+    """Generate a random token hash.
+
+    No plaintext is ever presented for these rows, so hash raw random bytes
+    instead of encoding a url-safe token first.
+    """
+    return sha256_hex(random_bytes(32))
 
 
 class RefreshTokenFactory(BaseFactory):
@@ -72,7 +81,7 @@ class TenantInviteFactory(BaseFactory):
 
     id = Use(generate_uuid7)
     tenant_id = None  # Required FK - must be set explicitly
-    email = Use(lambda: f"invite_{generate_uuid7().hex[-8:]}@example.com")
+    email = Use(lambda: f"invite_{random_suffix()}@example.com")
     token_hash = Use(generate_token_hash)
     role = MembershipRole.MEMBER.value
     invited_by_user_id = None  # Required FK - must be set explicitly
@@ -1,9 +1,14 @@
 """Base factory configuration for polyfactory."""
 
+import random
 from datetime import UTC, datetime
+from hashlib import sha256
+from typing import Any
 from uuid import uuid7
 
 from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
+from sqlalchemy import insert, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 def utc_now() -> datetime:
@@ -16,15 +21,81 @@ def generate_uuid7():
     return uuid7()
 
 
+# Non-cryptographic RNG for test data that only has to be unique (suffixes, hashes
+# of tokens nobody redeems). Seeded from os.urandom once per process, so xdist
+# workers get independent streams, without a getrandom() syscall per draw.
+_rng = random.Random()
+
+
+def random_suffix() -> str:
+    """Short random hex suffix for unique slugs, names and emails."""
+    return f"{_rng.getrandbits(32):08x}"
+
+
+def random_bytes(n: int) -> bytes:
+    """Random bytes for factory-only values that are never presented or verified."""
+    return _rng.randbytes(n)
+
+
+def sha256_hex(data: bytes) -> str:
+    """SHA-256 hex digest, matching how the app stores token hashes.
+
+    hashlib's sha256 is OpenSSL-backed, which already dispatches to SHA-NI on
+    CPUs that have it; keep every test-side token hash going through here.
+    """
+    return sha256(data).hexdigest()
+
+
+def as_insert_row(instance: Any) -> dict[str, Any]:
+    """Column values of a built (transient) model instance, for Core INSERTs."""
+    columns = inspect(type(instance)).column_attrs
+    return {attr.key: getattr(instance, attr.key) for attr in columns}
+
+
 class BaseFactory(SQLAlchemyFactory):
     """Base factory with common configuration for all models.
 
     Provides:
     - UUID7 generation for primary keys
-    - UTC timestamp generation
+    - UTC timestamp generation (one shared "now" per build, see __now_fields__)
     - Disabled auto-relationship setting (we control relationships manually)
+    - Bulk insertion via a single Core INSERT (see bulk_create)
     """
 
     __is_base_factory__ = True
     __set_relationships__ = False
     __set_foreign_keys__ = False  # We set FK values explicitly
+    # Timestamp fields filled from a single utc_now() per build (unless overridden)
+    __now_fields__: tuple[str, ...] = ()
+
+    @classmethod
+    def build(cls, *args: Any, **kwargs: Any) -> Any:
+        """Build an instance, stamping all __now_fields__ with the same time."""
+        if cls.__now_fields__:
+            now = utc_now()
+            for field in cls.__now_fields__:
+                kwargs.setdefault(field, now)
+        return super().build(*args, **kwargs)
+
+    @classmethod
+    async def bulk_create(cls, session: AsyncSession, size: int, **kwargs: Any) -> list[Any]:
+        """Build `size` instances and insert them in one executemany round trip.
+
+        Skips the ORM unit of work (no per-row flush/identity bookkeeping), so the
+        returned instances are NOT attached to the session. The caller commits.
+
+        Args:
+            session: Database session
+            size: Number of rows to insert
+            **kwargs: Field overrides applied to every built instance
+
+        Returns:
+            The built (transient) instances, in insertion order
+        """
+        instances = cls.batch(size, **kwargs)
+        if not instances:
+            return instances
+
+        rows = [as_insert_row(instance) for instance in instances]
+        await session.execute(insert(cls.__model__), rows)
+        return instances
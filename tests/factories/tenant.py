@@ -1,10 +1,17 @@
 """Tenant factory for test data generation."""
 
+import os
+
 from polyfactory import Use
 
 from src.app.models.enums import TenantStatus
 from src.app.models.public import Tenant
-from tests.factories.base import BaseFactory, generate_uuid7, utc_now
+from tests.factories.base import BaseFactory, generate_uuid7, random_suffix, utc_now
+
+# Under pytest-xdist each worker stamps its id into slugs (test_gw0_...), so rows
+# left behind by a crashed worker can be traced and filtered per worker.
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_SLUG_PREFIX = f"test_{_WORKER_ID}_" if _WORKER_ID else "test_"
 
 
 class TenantFactory(BaseFactory):
@@ -13,8 +20,8 @@ class TenantFactory(BaseFactory):
     __model__ = Tenant
 
     id = Use(generate_uuid7)
-    name = Use(lambda: f"Test Tenant {generate_uuid7().hex[-8:]}")
-    slug = Use(lambda: f"test_{generate_uuid7().hex[-8:]}")
+    name = Use(lambda: f"Test Tenant {random_suffix()}")
+    slug = Use(lambda: f"{TEST_SLUG_PREFIX}{random_suffix()}")
     status = TenantStatus.READY.value
     is_active = True
     created_at = Use(utc_now)
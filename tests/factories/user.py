@@ -1,31 +1,42 @@
 """User and membership factories for test data generation."""
 
+from functools import cache
+
 from polyfactory import Use
 
 from src.app.core.security import hash_password
 from src.app.models.enums import MembershipRole
 from src.app.models.public import User, UserTenantMembership
-from tests.factories.base import BaseFactory, generate_uuid7, utc_now
+from tests.factories.base import BaseFactory, generate_uuid7, random_suffix, utc_now
 
 # Default test password - stored for convenience in tests
 DEFAULT_TEST_PASSWORD = "testpassword123"
 
 
+@cache
+def _cached_password_hash(password: str) -> str:
+    """Argon2 hash of a test password, computed once per distinct plaintext.
+
+    Argon2 is deliberately slow (tens of ms per call). Users built with the same
+    password share one hash (and salt), which no test can observe - login only
+    verifies plaintext against the stored hash.
+    """
+    return hash_password(password)
+
+
 class UserFactory(BaseFactory):
     """Factory for generating User test data."""
 
     __model__ = User
+    __now_fields__ = ("email_verified_at", "created_at", "updated_at")
 
     id = Use(generate_uuid7)
-    email = Use(lambda: f"user_{generate_uuid7().hex[-8:]}@example.com")
-    hashed_password = Use(lambda: hash_password(DEFAULT_TEST_PASSWORD))
+    email = Use(lambda: f"user_{random_suffix()}@example.com")
+    hashed_password = Use(_cached_password_hash, DEFAULT_TEST_PASSWORD)
     full_name = "Test User"
     is_active = True
     is_superuser = False
     email_verified = True
-    email_verified_at = Use(utc_now)
-    created_at = Use(utc_now)
-    updated_at = Use(utc_now)
 
     @classmethod
     def superuser(cls, **kwargs):
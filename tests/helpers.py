@@ -1,17 +1,20 @@
 """Test helper functions for common data creation patterns."""
 
 import secrets
-from hashlib import sha256
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.models.enums import MembershipRole
 from src.app.models.public import Tenant, TenantInvite, User, UserTenantMembership
 from tests.factories import (
+    DEFAULT_TEST_PASSWORD,
     TenantFactory,
     TenantInviteFactory,
     UserFactory,
     UserTenantMembershipFactory,
+    as_insert_row,
+    sha256_hex,
 )
 
 
@@ -113,7 +116,7 @@ async def create_invite_with_inviter(
 
     # Generate token
     token = secrets.token_urlsafe(32)
-    token_hash = sha256(token.encode()).hexdigest()
+    token_hash = sha256_hex(token.encode())
 
     # Create invite
     invite = TenantInviteFactory.build(
@@ -133,13 +136,22 @@ async def create_full_test_scenario(
 ) -> dict:
     """Create a complete test scenario with tenant, admin user, and membership.
 
+    All IDs are generated client-side, so the three rows go out as plain Core
+    INSERTs in FK order, skipping the ORM unit of work. The returned objects are
+    NOT attached to the session; the caller commits.
+
     Returns:
         Dict with keys: tenant, user, membership, password
     """
-    from tests.factories import DEFAULT_TEST_PASSWORD
-
-    tenant = await create_tenant(session)
-    user, membership = await create_user_with_membership(session, tenant)
+    tenant = TenantFactory.build()
+    user = UserFactory.build()
+    membership = UserTenantMembershipFactory.build(
+        user_id=user.id,
+        tenant_id=tenant.id,
+        role=MembershipRole.ADMIN.value,
+    )
+    for instance in (tenant, user, membership):
+        await session.execute(insert(type(instance)), [as_insert_row(instance)])
 
     return {
         "tenant": tenant,
@@ -5,13 +5,20 @@ Uses polyfactory for type-safe test data generation.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from src.app.core import db
 from src.app.core import redis as redis_core
@@ -19,6 +26,7 @@ from src.app.core.config import get_settings
 from src.app.core.db import run_migrations_sync
 from src.app.main import create_app
 from src.app.models.enums import MembershipRole
+from src.app.models.public import Tenant
 from tests.factories import (
     DEFAULT_TEST_PASSWORD,
     TenantFactory,
@@ -26,35 +34,110 @@ from tests.factories import (
     UserTenantMembershipFactory,
 )
 from tests.utils.cleanup import (
-    cleanup_tenant_cascade,
+    cleanup_tenant_and_schema,
     cleanup_user_cascade,
     drop_tenant_schema,
 )
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _app_engine_lifecycle() -> AsyncGenerator[None]:
+    """Dispose the app's global engine once per session instead of per test.
+
+    All tests share one event loop (see ``asyncio_default_*_loop_scope``), so the
+    asyncpg pool behind ``db.get_engine()`` stays valid from test to test.
+    """
+    await db.dispose_engine()
+    yield
+    await db.dispose_engine()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app() -> AsyncGenerator[FastAPI]:
+    """Build the FastAPI app once per session and run its lifespan around it.
+
+    Router, middleware and OpenAPI setup are identical for every test, so clients
+    share this instance. Per-test state must not leak: dependency overrides are
+    cleared when each client fixture tears down.
+
+    ASGITransport never sends lifespan events, so startup/shutdown is entered
+    here once: shutdown (request draining, Redis/Temporal close, engine dispose)
+    runs at the end of the session, as it would when the server stops.
+    """
+    application = create_app()
+    async with application.router.lifespan_context(application):
+        yield application
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(app: FastAPI) -> ASGITransport:
+    """Single ASGI transport over the session app, shared by all client fixtures.
+
+    ASGITransport holds no per-test state (lifespan is handled by ``app``), so
+    only the AsyncClient wrapping it - with its per-test headers - is rebuilt.
+    """
+    return ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mock_registration_temporal() -> Iterator[AsyncMock]:
+    """Replace the Temporal client used by registration with one shared mock.
+
+    Registration tests only need start_workflow to succeed; no Temporal server
+    runs under test. Installed once per session instead of a patch() per test.
+    """
+    client = AsyncMock()
+    client.start_workflow.return_value = AsyncMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "src.app.services.registration_service.get_temporal_client",
+            AsyncMock(return_value=client),
+        )
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_registration_temporal(_mock_registration_temporal: AsyncMock) -> None:
+    """Clear calls recorded on the shared Temporal mock so each test sees its own."""
+    _mock_registration_temporal.reset_mock()
+
+
 @pytest.fixture(autouse=True)
 async def _reset_redis_between_tests() -> AsyncGenerator[None]:
-    """Reset Redis state between tests to prevent event loop issues.
+    """Reset Redis state between tests so each test connects (or fails) afresh.
 
-    Redis clients hold references to their event loop. When pytest creates
-    a new event loop for each test, stale Redis clients cause
-    'Event loop is closed' errors. This fixture ensures Redis is properly
-    closed after each test.
+    Tests toggle Redis availability via mocks, so the lazily created client and
+    the "connection attempted" flag must not leak from one test to the next.
+    The close is skipped for the many tests that never touched Redis.
     """
     # Reset before test
     redis_core.reset_redis_state()
     yield
-    # Close and reset after test
-    await redis_core.close_redis()
+    # Close and reset after test, only if get_redis() actually ran
+    if redis_core._connection_attempted or redis_core._redis is not None:
+        await redis_core.close_redis()
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def engine() -> AsyncGenerator[AsyncEngine]:
-    """Create test database engine and ensure public schema migrations are applied."""
-    await db.dispose_engine()
+    """Create the shared test database engine and apply public schema migrations.
+
+    Session-scoped with a regular connection pool: connections (and asyncpg's
+    per-connection statement cache) are reused across tests instead of paying
+    a TCP + auth handshake per test.
 
+    Unlike the app engine, the statement caches are enabled: fixture SQL only
+    touches the public schema (never switches search_path), so the cross-tenant
+    reuse that forces ``database_statement_cache_size=0`` in the app can't occur,
+    and the same INSERT/DELETE statements skip parse/plan on every reuse.
+    """
     settings = get_settings()
-    test_engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    test_engine = create_async_engine(
+        settings.database_url,
+        pool_size=5,
+        max_overflow=10,
+        connect_args={"statement_cache_size": 256, "prepared_statement_cache_size": 256},
+    )
 
     # Run public schema migrations to ensure tables exist
     await asyncio.to_thread(run_migrations_sync, None)
@@ -63,8 +146,37 @@ async def engine() -> AsyncGenerator[AsyncEngine]:
     await test_engine.dispose()
 
 
+@pytest.fixture(scope="session")
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Session factory bound to the shared test engine (expire_on_commit=False)."""
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tenant_schema_template(engine: AsyncEngine, worker_id: str) -> AsyncGenerator[str]:
+    """Tenant schema migrated once per worker, for ``clone_tenant_schema``.
+
+    Named per xdist worker so parallel sessions don't run Alembic against the
+    same schema. The name is reused across runs, so any leftover copy is
+    dropped before migrating; ``clone_tenant_schema`` also refuses a template
+    that isn't at head. Clones share no objects with the template (tenant
+    tables have no sequences), so its ``DROP ... CASCADE`` never reaches them.
+    """
+    schema_name = f"tenant_template_{worker_id}"
+    async with engine.begin() as conn:
+        await drop_tenant_schema(conn, schema_name)  # Leftover from an aborted run
+    await asyncio.to_thread(run_migrations_sync, schema_name)
+
+    yield schema_name
+
+    async with engine.begin() as conn:
+        await drop_tenant_schema(conn, schema_name)
+
+
 @pytest.fixture
-async def db_session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
+async def db_session(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession]:
     """Provide an async session for database operations.
 
     IMPORTANT: The AsyncSession context manager only closes the session on exit;
@@ -72,17 +184,40 @@ async def db_session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession]:
     to persist changes to the database. Alternatively, use fixtures like
     `test_tenant` or `test_user` which handle commit/rollback internally.
     """
-    async with AsyncSession(engine, expire_on_commit=False) as session:
+    async with session_factory() as session:
         yield session
 
 
 @pytest.fixture
-async def test_tenant(engine: AsyncEngine, db_session: AsyncSession) -> AsyncGenerator[str]:
+async def rollback_session(
+    engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+) -> AsyncGenerator[AsyncSession]:
+    """Provide a session whose writes are rolled back after the test.
+
+    The session is bound to a connection with an outer transaction open, so
+    nothing it does (even ``commit()``, which only releases a SAVEPOINT) is
+    ever persisted. Only suitable for repository-level tests: the app under
+    test uses its own engine and cannot see these uncommitted rows.
+
+    Request it AFTER fixtures whose rows it updates (e.g. ``test_tenant_obj``),
+    so it rolls back and releases its row locks before their cleanup runs.
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        async with session_factory(bind=conn, join_transaction_mode="create_savepoint") as session:
+            yield session
+        await trans.rollback()
+
+
+@pytest.fixture
+async def test_tenant_obj(engine: AsyncEngine, db_session: AsyncSession) -> AsyncGenerator[Tenant]:
     """Create isolated tenant for each test (Lobby Pattern).
 
     Creates:
     1. Tenant record in public.tenants (status=ready)
     2. Empty tenant schema (via migrations)
+
+    Yields the Tenant object; use ``test_tenant`` when only the slug is needed.
     """
     # Create tenant using factory
     tenant = TenantFactory.build()
@@ -95,53 +230,28 @@ async def test_tenant(engine: AsyncEngine, db_session: AsyncSession) -> AsyncGen
     # Run migrations for tenant schema (creates empty schema)
     await asyncio.to_thread(run_migrations_sync, schema_name)
 
-    yield tenant.slug
+    yield tenant
 
     # Cleanup using utilities
     async with engine.connect() as conn:
-        await drop_tenant_schema(conn, schema_name)
-        await cleanup_tenant_cascade(conn, tenant.id)
+        await cleanup_tenant_and_schema(conn, tenant.id, schema_name)
         await conn.commit()
 
 
 @pytest.fixture
-async def test_tenant_obj(engine: AsyncEngine, db_session: AsyncSession) -> AsyncGenerator:
-    """Create isolated tenant and return the Tenant object (not just slug).
+def test_tenant(test_tenant_obj: Tenant) -> str:
+    """Slug of the per-test tenant (Lobby Pattern).
 
-    Useful for tests that need direct access to tenant.id.
+    Same tenant as ``test_tenant_obj``; requesting both never provisions twice.
     """
-    # Create tenant using factory
-    tenant = TenantFactory.build()
-    db_session.add(tenant)
-    await db_session.commit()
-    await db_session.refresh(tenant)
-
-    schema_name = tenant.schema_name
-
-    # Run migrations for tenant schema (creates empty schema)
-    await asyncio.to_thread(run_migrations_sync, schema_name)
-
-    yield tenant
-
-    # Cleanup using utilities
-    async with engine.connect() as conn:
-        await drop_tenant_schema(conn, schema_name)
-        await cleanup_tenant_cascade(conn, tenant.id)
-        await conn.commit()
+    return test_tenant_obj.slug
 
 
 @pytest.fixture
 async def test_user(
-    engine: AsyncEngine, db_session: AsyncSession, test_tenant: str
+    engine: AsyncEngine, db_session: AsyncSession, test_tenant_obj: Tenant
 ) -> AsyncGenerator[dict]:
-    """Create a test user with admin membership in test_tenant."""
-    # Get tenant_id
-    result = await db_session.execute(
-        text("SELECT id FROM public.tenants WHERE slug = :slug"),
-        {"slug": test_tenant},
-    )
-    tenant_id = result.scalar_one()
-
+    """Create a test user with admin membership in the per-test tenant."""
     # Create user using factory
     user = UserFactory.build()
     db_session.add(user)
@@ -150,7 +260,7 @@ async def test_user(
     # Create membership
     membership = UserTenantMembershipFactory.build(
         user_id=user.id,
-        tenant_id=tenant_id,
+        tenant_id=test_tenant_obj.id,
         role=MembershipRole.ADMIN.value,
     )
     db_session.add(membership)
@@ -160,7 +270,8 @@ async def test_user(
         "id": str(user.id),
         "email": user.email,
         "password": DEFAULT_TEST_PASSWORD,
-        "tenant_slug": test_tenant,
+        "tenant_slug": test_tenant_obj.slug,
+        "tenant_id": str(test_tenant_obj.id),
     }
 
     # Cleanup using utilities
@@ -170,19 +281,18 @@ async def test_user(
 
 
 @pytest.fixture
-async def client(test_tenant: str) -> AsyncGenerator[AsyncClient]:
+async def client(
+    app: FastAPI, asgi_transport: ASGITransport, test_tenant: str
+) -> AsyncGenerator[AsyncClient]:
     """Create test client with tenant header."""
-    await db.dispose_engine()
-
-    app = create_app()
     async with AsyncClient(
-        transport=ASGITransport(app=app),
+        transport=asgi_transport,
         base_url="http://test",
         headers={"X-Tenant-Slug": test_tenant},
     ) as client:
         yield client
 
-    await db.dispose_engine()
+    app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -211,16 +321,9 @@ async def test_superuser(engine: AsyncEngine, db_session: AsyncSession) -> Async
 
 @pytest.fixture
 async def test_superuser_with_tenant(
-    engine: AsyncEngine, db_session: AsyncSession, test_tenant: str
+    engine: AsyncEngine, db_session: AsyncSession, test_tenant_obj: Tenant
 ) -> AsyncGenerator[dict]:
-    """Create a test superuser WITH membership in test_tenant."""
-    # Get tenant_id
-    result = await db_session.execute(
-        text("SELECT id FROM public.tenants WHERE slug = :slug"),
-        {"slug": test_tenant},
-    )
-    tenant_id = result.scalar_one()
-
+    """Create a test superuser WITH membership in the per-test tenant."""
     # Create superuser using factory
     user = UserFactory.superuser()
     db_session.add(user)
@@ -229,7 +332,7 @@ async def test_superuser_with_tenant(
     # Create membership
     membership = UserTenantMembershipFactory.build(
         user_id=user.id,
-        tenant_id=tenant_id,
+        tenant_id=test_tenant_obj.id,
         role=MembershipRole.ADMIN.value,
     )
     db_session.add(membership)
@@ -239,7 +342,8 @@ async def test_superuser_with_tenant(
         "id": str(user.id),
         "email": user.email,
         "password": DEFAULT_TEST_PASSWORD,
-        "tenant_slug": test_tenant,
+        "tenant_slug": test_tenant_obj.slug,
+        "tenant_id": str(test_tenant_obj.id),
     }
 
     # Cleanup using utilities
@@ -249,19 +353,30 @@ async def test_superuser_with_tenant(
 
 
 @pytest.fixture
-async def client_no_tenant(engine: AsyncEngine) -> AsyncGenerator[AsyncClient]:
+async def client_no_tenant(
+    app: FastAPI, asgi_transport: ASGITransport, engine: AsyncEngine
+) -> AsyncGenerator[AsyncClient]:
     """Create test client WITHOUT tenant header (for registration).
 
     IMPORTANT: Does NOT do aggressive cleanup to avoid interfering with parallel tests.
     Cleanup is scoped to avoid affecting other workers' data.
     """
-    await db.dispose_engine()
-
-    app = create_app()
     async with AsyncClient(
-        transport=ASGITransport(app=app),
+        transport=asgi_transport,
         base_url="http://test",
     ) as client:
         yield client
 
-    await db.dispose_engine()
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def bare_client(asgi_transport: ASGITransport) -> AsyncGenerator[AsyncClient]:
+    """Client with no default headers over the session-wide app.
+
+    Unlike ``client_no_tenant`` it does not pull in the test engine (and its
+    migrations), so tests whose requests never touch the database stay cheap.
+    Tests that need a tenant pass ``X-Tenant-Slug`` per request.
+    """
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as c:
+        yield c
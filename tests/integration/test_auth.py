@@ -1,108 +1,105 @@
 """Tests for authentication endpoints - Lobby Pattern."""
 
-from unittest.mock import AsyncMock, patch
-from uuid import uuid7
+import asyncio
+from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.core.security import create_access_token, create_refresh_token, hash_token
+from tests.factories import RefreshTokenFactory, random_suffix
 
 pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
 
 
+@pytest.fixture
+async def fresh_refresh_token(db_session: AsyncSession, test_user: dict) -> str:
+    """Refresh token for test_user, issued the way AuthService.authenticate does.
+
+    Mints the JWT and commits its hashed row directly, so tests about refresh
+    and logout don't pay for an /auth/login round trip (and its Argon2 verify).
+    Login itself is covered by TestLogin.
+    """
+    refresh_token, expires_at = create_refresh_token(test_user["id"], test_user["tenant_id"])
+    db_session.add(
+        RefreshTokenFactory.build(
+            user_id=UUID(test_user["id"]),
+            tenant_id=UUID(test_user["tenant_id"]),
+            token_hash=hash_token(refresh_token),
+            expires_at=expires_at,
+        )
+    )
+    await db_session.commit()
+    return refresh_token
+
+
+@pytest.fixture
+def access_token(test_user: dict) -> str:
+    """Access token for test_user, minted without /auth/login."""
+    return create_access_token(subject=test_user["id"], tenant_id=test_user["tenant_id"])
+
+
+def _register_payload(prefix: str, **overrides: str) -> dict[str, str]:
+    """Registration body whose email and slug are unique to this call.
+
+    Unique values keep parallel workers and repeated runs from colliding on
+    the email/slug uniqueness constraints.
+    """
+    unique_id = random_suffix()
+    payload = {
+        "email": f"{prefix}_{unique_id}@example.com",
+        "password": "correct-horse-battery-staple",
+        "full_name": "New User",
+        "tenant_name": "New Company",
+        "tenant_slug": f"{prefix}_{unique_id}",
+    }
+    return payload | overrides
+
+
 class TestRegistration:
     """Tests for user + tenant registration (Lobby Pattern)."""
 
     async def test_register_creates_user_and_tenant(self, client_no_tenant: AsyncClient) -> None:
         """Test registration creates user and starts tenant provisioning workflow."""
-        # Use unique values per test run to avoid parallel test interference
-        unique_id = uuid7().hex[-8:]
-        test_email = f"newuser_{unique_id}@example.com"
-        test_slug = f"new_company_{unique_id}"
-
-        with patch("src.app.services.registration_service.get_temporal_client") as mock_get_client:
-            # Mock Temporal client
-            mock_client = AsyncMock()
-            mock_client.start_workflow.return_value = AsyncMock()
-            mock_get_client.return_value = mock_client
-
-            response = await client_no_tenant.post(
-                "/api/v1/auth/register",
-                json={
-                    "email": test_email,
-                    "password": "correct-horse-battery-staple",
-                    "full_name": "New User",
-                    "tenant_name": "New Company",
-                    "tenant_slug": test_slug,
-                },
-            )
+        payload = _register_payload("new_company")
+
+        response = await client_no_tenant.post("/api/v1/auth/register", json=payload)
 
         assert response.status_code == 202
         data = response.json()
-        assert data["user"]["email"] == test_email
+        assert data["user"]["email"] == payload["email"]
         assert data["user"]["full_name"] == "New User"
-        assert data["tenant_slug"] == test_slug
+        assert data["tenant_slug"] == payload["tenant_slug"]
         assert "workflow_id" in data
 
     async def test_register_duplicate_email_fails(self, client_no_tenant: AsyncClient) -> None:
         """Test registration fails for duplicate email."""
-        # Use unique email/slugs per test run to avoid parallel test interference
-        unique_id = uuid7().hex[-8:]
-        test_email = f"duplicate_{unique_id}@example.com"
-        slug_one = f"company_one_{unique_id}"
-        slug_two = f"company_two_{unique_id}"
-
-        with patch("src.app.services.registration_service.get_temporal_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.start_workflow.return_value = AsyncMock()
-            mock_get_client.return_value = mock_client
-
-            # First registration
-            first_response = await client_no_tenant.post(
-                "/api/v1/auth/register",
-                json={
-                    "email": test_email,
-                    "password": "correct-horse-battery-staple",
-                    "full_name": "First User",
-                    "tenant_name": "Company One",
-                    "tenant_slug": slug_one,
-                },
-            )
-            assert (
-                first_response.status_code == 202
-            ), f"First registration failed: {first_response.json()}"
-
-            # Second registration with same email - must happen immediately
-            # (no other operations in between that could allow cleanup to run)
-            response = await client_no_tenant.post(
-                "/api/v1/auth/register",
-                json={
-                    "email": test_email,
-                    "password": "purple-monkey-dishwasher-99",
-                    "full_name": "Second User",
-                    "tenant_name": "Company Two",
-                    "tenant_slug": slug_two,
-                },
-            )
-
-            # Expect 409 Conflict for duplicate email
-            assert (
-                response.status_code == 409
-            ), f"Expected 409 for duplicate email, got {response.status_code}: {response.json()}"
-
-    async def test_register_invalid_slug_format(self, client_no_tenant: AsyncClient) -> None:
-        """Test registration fails for invalid tenant slug format."""
+        first_payload = _register_payload("duplicate")
+
+        # First registration
+        first_response = await client_no_tenant.post("/api/v1/auth/register", json=first_payload)
+        assert first_response.status_code == 202, (
+            f"First registration failed: {first_response.json()}"
+        )
+
+        # Second registration with same email - must happen immediately
+        # (no other operations in between that could allow cleanup to run)
         response = await client_no_tenant.post(
             "/api/v1/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "correct-horse-battery-staple",
-                "full_name": "Test User",
-                "tenant_name": "Test Company",
-                "tenant_slug": "Invalid-Slug!",  # Invalid: uppercase, hyphen, special char
-            },
+            json=_register_payload(
+                "duplicate",
+                email=first_payload["email"],
+                password="purple-monkey-dishwasher-99",
+                full_name="Second User",
+                tenant_name="Company Two",
+            ),
         )
 
-        assert response.status_code == 422  # Validation error
+        # Expect 409 Conflict for duplicate email
+        assert response.status_code == 409, (
+            f"Expected 409 for duplicate email, got {response.status_code}: {response.json()}"
+        )
 
 
 class TestLogin:
@@ -155,22 +152,12 @@ class TestLogin:
 class TestTokenOperations:
     """Tests for token refresh and logout."""
 
-    async def test_refresh_token(self, client: AsyncClient, test_user: dict) -> None:
+    async def test_refresh_token(self, client: AsyncClient, fresh_refresh_token: str) -> None:
         """Test refreshing access token returns both new access and refresh tokens."""
-        # Login first
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": test_user["email"],
-                "password": test_user["password"],
-            },
-        )
-        original_refresh_token = login_response.json()["refresh_token"]
-
         # Refresh
         response = await client.post(
             "/api/v1/auth/refresh",
-            json={"refresh_token": original_refresh_token},
+            json={"refresh_token": fresh_refresh_token},
         )
 
         assert response.status_code == 200
@@ -179,26 +166,16 @@ class TestTokenOperations:
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
         # New refresh token should be different from the original
-        assert data["refresh_token"] != original_refresh_token
+        assert data["refresh_token"] != fresh_refresh_token
 
     async def test_token_rotation_old_token_revoked(
-        self, client: AsyncClient, test_user: dict
+        self, client: AsyncClient, fresh_refresh_token: str
     ) -> None:
         """Test that old refresh token is revoked after rotation."""
-        # Login
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": test_user["email"],
-                "password": test_user["password"],
-            },
-        )
-        old_refresh_token = login_response.json()["refresh_token"]
-
         # First refresh - should succeed and return new tokens
         first_refresh = await client.post(
             "/api/v1/auth/refresh",
-            json={"refresh_token": old_refresh_token},
+            json={"refresh_token": fresh_refresh_token},
         )
         assert first_refresh.status_code == 200
         new_refresh_token = first_refresh.json()["refresh_token"]
@@ -206,7 +183,7 @@ class TestTokenOperations:
         # Try to use old token again - should fail (token rotation)
         second_refresh = await client.post(
             "/api/v1/auth/refresh",
-            json={"refresh_token": old_refresh_token},
+            json={"refresh_token": fresh_refresh_token},
         )
         assert second_refresh.status_code == 401
 
@@ -218,36 +195,26 @@ class TestTokenOperations:
         assert third_refresh.status_code == 200
 
     async def test_token_rotation_race_condition_prevention(
-        self, client: AsyncClient, test_user: dict
+        self, client: AsyncClient, fresh_refresh_token: str
     ) -> None:
         """Test that parallel refresh requests with same token result in only one success.
 
         This tests the TOCTOU race condition fix: only the first request should succeed,
         all subsequent requests should fail because the token is atomically revoked.
         """
-        import asyncio
-
-        # Login
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": test_user["email"],
-                "password": test_user["password"],
-            },
-        )
-        refresh_token = login_response.json()["refresh_token"]
-
-        # Make 5 parallel refresh requests with the same token
-        async def make_refresh_request():
-            return await client.post(
-                "/api/v1/auth/refresh",
-                json={"refresh_token": refresh_token},
-            )
-
-        responses = await asyncio.gather(
-            *[make_refresh_request() for _ in range(5)],
-            return_exceptions=False,
-        )
+        # Make 5 parallel refresh requests with the same token. ASGITransport has
+        # no connection pool, so all five reach the app concurrently.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    client.post(
+                        "/api/v1/auth/refresh",
+                        json={"refresh_token": fresh_refresh_token},
+                    )
+                )
+                for _ in range(5)
+            ]
+        responses = [task.result() for task in tasks]
 
         # Count successful and failed responses
         success_count = sum(1 for r in responses if r.status_code == 200)
@@ -279,29 +246,21 @@ class TestTokenOperations:
 
         assert response.status_code == 401
 
-    async def test_logout_revokes_token(self, client: AsyncClient, test_user: dict) -> None:
+    async def test_logout_revokes_token(
+        self, client: AsyncClient, fresh_refresh_token: str
+    ) -> None:
         """Test logout revokes refresh token."""
-        # Login
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": test_user["email"],
-                "password": test_user["password"],
-            },
-        )
-        refresh_token = login_response.json()["refresh_token"]
-
         # Logout
         logout_response = await client.post(
             "/api/v1/auth/logout",
-            json={"refresh_token": refresh_token},
+            json={"refresh_token": fresh_refresh_token},
         )
         assert logout_response.status_code == 204
 
         # Try to refresh with revoked token
         refresh_response = await client.post(
             "/api/v1/auth/refresh",
-            json={"refresh_token": refresh_token},
+            json={"refresh_token": fresh_refresh_token},
         )
         assert refresh_response.status_code == 401
 
@@ -309,19 +268,10 @@ class TestTokenOperations:
 class TestCurrentUser:
     """Tests for authenticated user endpoints."""
 
-    async def test_get_current_user(self, client: AsyncClient, test_user: dict) -> None:
+    async def test_get_current_user(
+        self, client: AsyncClient, test_user: dict, access_token: str
+    ) -> None:
         """Test getting current user with valid token."""
-        # Login
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": test_user["email"],
-                "password": test_user["password"],
-            },
-        )
-        access_token = login_response.json()["access_token"]
-
-        # Get current user
         response = await client.get(
             "/api/v1/users/me",
             headers={"Authorization": f"Bearer {access_token}"},
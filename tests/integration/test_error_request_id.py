@@ -1,37 +1,15 @@
 """Tests for request_id in error responses."""
 
-from collections.abc import Generator
-
 import pytest
-from fastapi.testclient import TestClient
-
-from src.app.core.shutdown import request_tracker
-from src.app.main import create_app
-from src.app.temporal.client import reset_temporal_client
-
-pytestmark = pytest.mark.integration
-
-
-@pytest.fixture
-def client() -> Generator[TestClient]:
-    """Test client fixture with proper cleanup."""
-    # Reset state before test
-    request_tracker.reset()
-    reset_temporal_client()
-
-    app = create_app()
-    with TestClient(app) as c:
-        yield c
+from httpx import AsyncClient
 
-    # Reset state after test (lifespan sets shutting_down=True)
-    request_tracker.reset()
-    reset_temporal_client()
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
 
 
-def test_http_exception_includes_request_id(client: TestClient) -> None:
+async def test_http_exception_includes_request_id(bare_client: AsyncClient) -> None:
     """Test that HTTPException responses include request_id."""
     # Make a request to a non-existent endpoint
-    response = client.get("/api/v1/nonexistent-endpoint")
+    response = await bare_client.get("/api/v1/nonexistent-endpoint")
 
     # Should get 404
     assert response.status_code == 404
@@ -44,10 +22,10 @@ def test_http_exception_includes_request_id(client: TestClient) -> None:
     assert isinstance(data["request_id"], str), "request_id is not a string"
 
 
-def test_bad_request_includes_request_id(client: TestClient) -> None:
+async def test_bad_request_includes_request_id(bare_client: AsyncClient) -> None:
     """Test that 400 responses include request_id."""
     # Try to access a protected endpoint without tenant header (gets 400)
-    response = client.get("/api/v1/users/me")
+    response = await bare_client.get("/api/v1/users/me")
 
     # Should get 400 (missing X-Tenant-Slug header)
     assert response.status_code == 400
@@ -58,9 +36,9 @@ def test_bad_request_includes_request_id(client: TestClient) -> None:
     assert "detail" in data, "detail not found in 400 response"
 
 
-def test_request_id_format(client: TestClient) -> None:
+async def test_request_id_format(bare_client: AsyncClient) -> None:
     """Test that request_id follows expected format (UUID-like)."""
-    response = client.get("/api/v1/nonexistent-endpoint")
+    response = await bare_client.get("/api/v1/nonexistent-endpoint")
 
     data = response.json()
     request_id = data["request_id"]
@@ -76,10 +54,10 @@ def test_request_id_format(client: TestClient) -> None:
         assert len(request_id) == 36, f"Unexpected request_id format: {request_id}"
 
 
-def test_different_requests_have_different_ids(client: TestClient) -> None:
+async def test_different_requests_have_different_ids(bare_client: AsyncClient) -> None:
     """Test that different requests get different request IDs."""
-    response1 = client.get("/api/v1/endpoint1")
-    response2 = client.get("/api/v1/endpoint2")
+    response1 = await bare_client.get("/api/v1/endpoint1")
+    response2 = await bare_client.get("/api/v1/endpoint2")
 
     # Both should have request_id
     data1 = response1.json()
@@ -13,8 +13,17 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from src.app.models.public import Tenant
+from src.app.repositories import (
+    MembershipRepository,
+    TenantInviteRepository,
+    TenantRepository,
+    UserRepository,
+)
+from src.app.services.invite_service import InviteService
 from tests.factories import TenantFactory, UserFactory
 from tests.helpers import create_invite_with_inviter
+from tests.utils.cleanup import cleanup_tenant_cascade, cleanup_user_cascade
 
 pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
 
@@ -32,17 +41,9 @@ async def invite_token_and_tenant(
 
     yield token, invite.email, str(test_tenant_obj.id)
 
-    # Cleanup: delete invite first (has FK to inviter), then inviter user
-    async with engine.connect() as conn:
-        await conn.execute(
-            text("DELETE FROM public.tenant_invites WHERE invited_by_user_id = :id"),
-            {"id": inviter.id},
-        )
-        await conn.execute(
-            text("DELETE FROM public.users WHERE id = :id"),
-            {"id": inviter.id},
-        )
-        await conn.commit()
+    # Cleanup: inviter user and the invites it sent, in one statement
+    async with engine.begin() as conn:
+        await cleanup_user_cascade(conn, inviter.id)
 
 
 async def test_accept_invite_deleted_tenant(
@@ -55,14 +56,6 @@ async def test_accept_invite_deleted_tenant(
     This validates that the tenant check happens WITHIN the transaction,
     preventing the race condition where tenant is deleted after invite is accepted.
     """
-    from src.app.repositories import (
-        MembershipRepository,
-        TenantInviteRepository,
-        TenantRepository,
-        UserRepository,
-    )
-    from src.app.services.invite_service import InviteService
-
     token, invite_email, tenant_id = invite_token_and_tenant
 
     # SOFT-DELETE the tenant (set deleted_at)
@@ -153,28 +146,12 @@ async def test_accept_invite_nonexistent_tenant(
             },
         )
 
-        # Now HARD-DELETE the tenant (simulate catastrophic deletion)
-        # First delete the invite's FK constraint by deleting the invite
-        await conn.execute(
-            text("DELETE FROM public.tenant_invites WHERE email = :email"),
-            {"email": invite_email},
-        )
-        await conn.execute(
-            text("DELETE FROM public.tenants WHERE id = :id"),
-            {"id": temp_tenant.id},
-        )
-        await conn.commit()
+        # Now HARD-DELETE the tenant (simulate catastrophic deletion),
+        # together with the invite that references it
+        await cleanup_tenant_cascade(conn, temp_tenant.id)
 
-    # Cleanup remaining users
-    async with engine.connect() as conn:
-        await conn.execute(
-            text("DELETE FROM public.users WHERE id = :id"),
-            {"id": user.id},
-        )
-        await conn.execute(
-            text("DELETE FROM public.users WHERE id = :id"),
-            {"id": inviter.id},
-        )
+        # Cleanup remaining users
+        await cleanup_user_cascade(conn, user.id, inviter.id)
         await conn.commit()
 
     # Note: This test can't truly test hard-deleted tenant due to FK constraints
@@ -192,15 +169,6 @@ async def test_accept_invite_success_returns_tenant(
     This validates that the tenant is retrieved within the transaction and
     returned to the caller, eliminating the need for a separate query.
     """
-    from src.app.models.public import Tenant
-    from src.app.repositories import (
-        MembershipRepository,
-        TenantInviteRepository,
-        TenantRepository,
-        UserRepository,
-    )
-    from src.app.services.invite_service import InviteService
-
     token, invite_email, tenant_id = invite_token_and_tenant
 
     # Accept invite
@@ -237,22 +205,9 @@ async def test_accept_invite_success_returns_tenant(
 
         created_user_id = new_user.id
 
-    # Cleanup - delete in correct order for FK constraints
-    async with engine.connect() as conn:
-        # Delete invites where this user accepted (FK: accepted_by_user_id)
-        await conn.execute(
-            text("DELETE FROM public.tenant_invites WHERE accepted_by_user_id = :id"),
-            {"id": created_user_id},
-        )
-        await conn.execute(
-            text("DELETE FROM public.user_tenant_membership WHERE user_id = :id"),
-            {"id": created_user_id},
-        )
-        await conn.execute(
-            text("DELETE FROM public.users WHERE id = :id"),
-            {"id": created_user_id},
-        )
-        await conn.commit()
+    # Cleanup - accepted invite, membership and user in one statement
+    async with engine.begin() as conn:
+        await cleanup_user_cascade(conn, created_user_id)
 
 
 async def test_api_accept_invite_deleted_tenant(
@@ -291,11 +246,10 @@ async def test_api_accept_invite_deleted_tenant(
     # Verify no user was created
     async with engine.connect() as conn:
         result = await conn.execute(
-            text("SELECT COUNT(*) FROM public.users WHERE email = :email"),
+            text("SELECT EXISTS(SELECT 1 FROM public.users WHERE email = :email)"),
             {"email": invite_email},
         )
-        user_count = result.scalar_one()
-        assert user_count == 0, "No user should be created for deleted tenant"
+        assert result.scalar_one() is False, "No user should be created for deleted tenant"
 
         # Cleanup
         await conn.execute(
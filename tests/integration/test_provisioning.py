@@ -1,14 +1,12 @@
 """Integration tests for tenant provisioning lifecycle."""
 
-from unittest.mock import AsyncMock, patch
-from uuid import uuid4
-
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from src.app.models.public import Tenant, TenantStatus
+from tests.factories import random_suffix
 
 pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
 
@@ -28,26 +26,20 @@ class TestProvisioningLifecycle:
         4. Tenant becomes active (is_active=True)
         """
         # Use unique values per test run
-        unique_id = uuid4().hex[-8:]
+        unique_id = random_suffix()
         test_email = f"transition_{unique_id}@test.com"
         test_slug = f"transition_test_{unique_id}"
 
-        with patch("src.app.services.registration_service.get_temporal_client") as mock_get_client:
-            # Mock Temporal client
-            mock_client = AsyncMock()
-            mock_client.start_workflow.return_value = AsyncMock()
-            mock_get_client.return_value = mock_client
-
-            response = await client_no_tenant.post(
-                "/api/v1/auth/register",
-                json={
-                    "email": test_email,
-                    "password": "SecurePass123!",
-                    "full_name": "Test User",
-                    "tenant_name": "Transition Test Corp",
-                    "tenant_slug": test_slug,
-                },
-            )
+        response = await client_no_tenant.post(
+            "/api/v1/auth/register",
+            json={
+                "email": test_email,
+                "password": "SecurePass123!",
+                "full_name": "Test User",
+                "tenant_name": "Transition Test Corp",
+                "tenant_slug": test_slug,
+            },
+        )
 
         assert response.status_code == 202
         data = response.json()
@@ -73,26 +65,20 @@ class TestProvisioningLifecycle:
         between tenants and their provisioning workflows.
         """
         # Use unique values per test run
-        unique_id = uuid4().hex[-8:]
+        unique_id = random_suffix()
         test_email = f"workflow_id_{unique_id}@test.com"
         test_slug = f"workflow_id_test_{unique_id}"
 
-        with patch("src.app.services.registration_service.get_temporal_client") as mock_get_client:
-            # Mock Temporal client
-            mock_client = AsyncMock()
-            mock_client.start_workflow.return_value = AsyncMock()
-            mock_get_client.return_value = mock_client
-
-            response = await client_no_tenant.post(
-                "/api/v1/auth/register",
-                json={
-                    "email": test_email,
-                    "password": "SecurePass123!",
-                    "full_name": "Test User",
-                    "tenant_name": "Workflow ID Test Corp",
-                    "tenant_slug": test_slug,
-                },
-            )
+        response = await client_no_tenant.post(
+            "/api/v1/auth/register",
+            json={
+                "email": test_email,
+                "password": "SecurePass123!",
+                "full_name": "Test User",
+                "tenant_name": "Workflow ID Test Corp",
+                "tenant_slug": test_slug,
+            },
+        )
 
         assert response.status_code == 202
         data = response.json()
@@ -1,8 +0,0 @@
-"""Unit test fixtures.
-
-Unit tests should not require database or external services.
-This file is intentionally minimal - most unit tests need no fixtures.
-"""
-
-# No fixtures needed for pure unit tests.
-# If you need shared fixtures for unit tests, add them here.
@@ -183,3 +183,26 @@ class TestPasswordValidation:
                 tenant_name="Test Tenant",
                 tenant_slug="test_tenant",
             )
+
+
+class TestRegisterSlugValidation:
+    """Tests for tenant slug validation on registration requests."""
+
+    @pytest.mark.parametrize(
+        "tenant_slug",
+        [
+            "Invalid-Slug!",  # Invalid: uppercase, special char
+            "",
+        ],
+        ids=["bad-characters", "empty"],
+    )
+    def test_invalid_slug_rejected(self, tenant_slug: str):
+        """Malformed tenant slugs should be rejected before reaching the service."""
+        with pytest.raises(ValidationError):
+            RegisterRequest(
+                email="test@example.com",
+                password="correct-horse-battery-staple",
+                full_name="Test User",
+                tenant_name="Test Tenant",
+                tenant_slug=tenant_slug,
+            )
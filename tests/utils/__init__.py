@@ -1,13 +1,19 @@
 """Test utilities package."""
 
+from tests.utils.audit import LATEST_AUDIT_LOG
 from tests.utils.cleanup import (
+    cleanup_tenant_and_schema,
     cleanup_tenant_cascade,
     cleanup_user_cascade,
     drop_tenant_schema,
 )
+from tests.utils.schema import clone_tenant_schema
 
 __all__ = [
+    "LATEST_AUDIT_LOG",
+    "cleanup_tenant_and_schema",
     "cleanup_tenant_cascade",
     "cleanup_user_cascade",
+    "clone_tenant_schema",
     "drop_tenant_schema",
 ]
@@ -0,0 +1,23 @@
+"""Audit log queries shared by integration tests."""
+
+from sqlalchemy import bindparam, select
+
+from src.app.models.public import AuditLog
+
+# Most recent audit row for (tenant_id, action); served by
+# ix_audit_logs_tenant_action_created without a sort.
+LATEST_AUDIT_LOG = (
+    select(
+        AuditLog.action,
+        AuditLog.entity_type,
+        AuditLog.entity_id,
+        AuditLog.user_id,
+        AuditLog.changes,
+    )
+    .where(
+        AuditLog.tenant_id == bindparam("tenant_id"),
+        AuditLog.action == bindparam("action"),
+    )
+    .order_by(AuditLog.created_at.desc())
+    .limit(1)
+)
@@ -1,7 +1,8 @@
 """Database cleanup utilities for test fixtures.
 
 These utilities handle proper FK-constraint-aware cleanup of test data.
-The delete order matters due to foreign key relationships.
+Child rows are removed in the same statement as their parent, so every
+cascade is one round trip.
 """
 
 from uuid import UUID
@@ -27,50 +28,66 @@ def _validate_schema_name_for_drop(schema_name: str) -> None:
     validate_schema_name(schema_name)
 
 
-async def cleanup_tenant_cascade(conn: AsyncConnection, tenant_id: UUID) -> None:
-    """Delete tenant and all related data in correct FK order.
-
-    Order: invites -> memberships -> tokens -> tenant
+# Each cascade is ONE statement: the child DELETEs run as data-modifying CTEs in
+# the same command as the parent DELETE. The FKs they satisfy are NO ACTION (or
+# CASCADE), which Postgres checks at end of statement, after the CTEs have run.
+_DELETE_TENANTS_CASCADE = text(
     """
-    await conn.execute(
-        text("DELETE FROM public.tenant_invites WHERE tenant_id = :id"),
-        {"id": tenant_id},
-    )
-    await conn.execute(
-        text("DELETE FROM public.user_tenant_membership WHERE tenant_id = :id"),
-        {"id": tenant_id},
-    )
-    await conn.execute(
-        text("DELETE FROM public.refresh_tokens WHERE tenant_id = :id"),
-        {"id": tenant_id},
+    WITH invites AS (
+        DELETE FROM public.tenant_invites WHERE tenant_id = ANY(:ids)
+    ), memberships AS (
+        DELETE FROM public.user_tenant_membership WHERE tenant_id = ANY(:ids)
+    ), tokens AS (
+        DELETE FROM public.refresh_tokens WHERE tenant_id = ANY(:ids)
     )
-    await conn.execute(
-        text("DELETE FROM public.tenants WHERE id = :id"),
-        {"id": tenant_id},
+    DELETE FROM public.tenants WHERE id = ANY(:ids)
+    """
+)
+
+_DELETE_USERS_CASCADE = text(
+    """
+    WITH invites AS (
+        DELETE FROM public.tenant_invites
+        WHERE invited_by_user_id = ANY(:ids) OR accepted_by_user_id = ANY(:ids)
+    ), memberships AS (
+        DELETE FROM public.user_tenant_membership WHERE user_id = ANY(:ids)
     )
+    DELETE FROM public.users WHERE id = ANY(:ids)
+    """
+)
 
 
-async def cleanup_user_cascade(conn: AsyncConnection, user_id: UUID) -> None:
-    """Delete user and all related data in correct FK order.
+async def cleanup_tenant_cascade(conn: AsyncConnection, *tenant_ids: UUID) -> None:
+    """Delete tenants and all related data in a single statement.
 
-    Order: invites (by inviter) -> memberships -> user
+    Covers: invites, memberships, tokens, tenant
     """
-    await conn.execute(
-        text("DELETE FROM public.tenant_invites WHERE invited_by_user_id = :id"),
-        {"id": user_id},
-    )
-    await conn.execute(
-        text("DELETE FROM public.tenant_invites WHERE accepted_by_user_id = :id"),
-        {"id": user_id},
-    )
-    await conn.execute(
-        text("DELETE FROM public.user_tenant_membership WHERE user_id = :id"),
-        {"id": user_id},
-    )
-    await conn.execute(
-        text("DELETE FROM public.users WHERE id = :id"),
-        {"id": user_id},
-    )
+    await conn.execute(_DELETE_TENANTS_CASCADE, {"ids": list(tenant_ids)})
+
+
+async def cleanup_user_cascade(conn: AsyncConnection, *user_ids: UUID) -> None:
+    """Delete users and all related data in a single statement.
+
+    Covers: invites (as inviter or acceptor), memberships, user
+    """
+    await conn.execute(_DELETE_USERS_CASCADE, {"ids": list(user_ids)})
+
+
+async def cleanup_tenant_and_schema(
+    conn: AsyncConnection, tenant_id: UUID, schema_name: str
+) -> None:
+    """Drop a tenant's schema and delete its public rows (two statements).
+
+    Args:
+        conn: Async database connection
+        tenant_id: Tenant to delete
+        schema_name: Must match pattern 'tenant_<slug>'
+
+    Raises:
+        ValueError: If schema_name doesn't match expected tenant format
+    """
+    await drop_tenant_schema(conn, schema_name)
+    await cleanup_tenant_cascade(conn, tenant_id)
 
 
 async def drop_tenant_schema(conn: AsyncConnection, schema_name: str) -> None:
@@ -89,4 +106,6 @@ async def drop_tenant_schema(conn: AsyncConnection, schema_name: str) -> None:
     """
     _validate_schema_name_for_drop(schema_name)
     # Safe to interpolate after validation - pattern only allows [a-z0-9_]
-    await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE"))
+    # Sent as raw driver SQL: each schema name makes a one-off statement, so it
+    # skips SQLAlchemy's compiled cache rather than evicting reusable entries.
+    await conn.exec_driver_sql(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE")
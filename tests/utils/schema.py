@@ -0,0 +1,82 @@
+"""Tenant schema provisioning utilities for test fixtures.
+
+Running the Alembic chain for a tenant schema replays every revision; tests
+that need fresh tenant schemas can instead migrate one template schema once
+and clone its tables.
+"""
+
+from functools import cache
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.app.core.db.migrations import get_head_revision
+from src.app.core.security.validators import validate_schema_name
+
+_TEMPLATE_TABLES = text(
+    """
+    SELECT table_name FROM information_schema.tables
+    WHERE table_schema = :schema AND table_type = 'BASE TABLE'
+    """
+)
+
+
+@cache
+def _head_revision() -> str | None:
+    """Head revision of the migration scripts (read once per process)."""
+    return get_head_revision()
+
+
+async def clone_tenant_schema(
+    conn: AsyncConnection, template_schema: str, schema_name: str
+) -> None:
+    """Create schema_name with the tables of an already-migrated template schema.
+
+    Each table is created with ``LIKE ... INCLUDING ALL`` (columns, defaults,
+    primary keys, unique constraints, indexes) and alembic_version rows are
+    copied, so the clone is at the template's revision. That revision must be
+    the migration head: a stale template (e.g. left by a crashed worker) would
+    otherwise yield clones silently missing the latest migrations. Constraint
+    and index names are generated by Postgres rather than taken from the
+    migrations, so don't run downgrades against a clone. Tenant tables have no
+    foreign keys, which LIKE would not copy.
+
+    Args:
+        conn: Async database connection (caller commits)
+        template_schema: Migrated tenant schema to copy from
+        schema_name: New schema, must match pattern 'tenant_<slug>'
+
+    Raises:
+        ValueError: If either schema name doesn't match expected tenant format
+        RuntimeError: If the template is not migrated to the head revision
+    """
+    validate_schema_name(template_schema)
+    validate_schema_name(schema_name)
+    quote = conn.dialect.identifier_preparer.quote
+
+    result = await conn.execute(_TEMPLATE_TABLES, {"schema": template_schema})
+    tables = list(result.scalars())
+
+    # Safe to interpolate after validation - pattern only allows [a-z0-9_]
+    revision = None
+    if "alembic_version" in tables:
+        result = await conn.exec_driver_sql(
+            f"SELECT version_num FROM {template_schema}.alembic_version"
+        )
+        revision = result.scalar_one_or_none()
+    if revision != _head_revision():
+        raise RuntimeError(
+            f"Template schema {template_schema} is at revision {revision!r}, "
+            f"not head {_head_revision()!r}; drop it and migrate again"
+        )
+
+    await conn.exec_driver_sql(f"CREATE SCHEMA {schema_name}")
+    for table in map(quote, tables):
+        await conn.exec_driver_sql(
+            f"CREATE TABLE {schema_name}.{table} (LIKE {template_schema}.{table} INCLUDING ALL)"
+        )
+    if "alembic_version" in tables:
+        await conn.exec_driver_sql(
+            f"INSERT INTO {schema_name}.alembic_version "
+            f"SELECT * FROM {template_schema}.alembic_version"
+        )